@@ -1244,6 +1244,118 @@ def run_dynamical_matrix_solver_c(
     return dynmat
 
 
+def solve_dynamical_matrix(dynmat, with_eigenvectors=True, tolerance=1e-12):
+    """Solve eigenvalue problem of a dynamical matrix.
+
+    When only eigenvalues are requested and the imaginary part of the
+    dynamical matrix vanishes, e.g., at Gamma point, it is solved as a real
+    symmetric matrix, which is cheaper than solving it as a complex Hermitian
+    matrix. Eigenvectors are always obtained by the complex Hermitian solver
+    as done by solve_dynamical_matrices_c. A real symmetric solver chooses a
+    different basis in degenerate subspaces, which changes band-resolved
+    quantities such as projected DOS, so that the results would depend on
+    whether phonopy is built with OpenMP or not.
+
+    Parameters
+    ----------
+    dynmat : ndarray
+        Dynamical matrix.
+        shape=(num_band, num_band), dtype=complex
+    with_eigenvectors : bool, optional
+        Eigenvectors are calculated or not. Default is True.
+    tolerance : float, optional
+        Dynamical matrix is considered as real when absolute values of all
+        imaginary parts are smaller than this value. This is used only with
+        with_eigenvectors=False. Default is 1e-12.
+
+    Returns
+    -------
+    eigvals : ndarray
+        Eigenvalues. shape=(num_band,), dtype='double'
+    eigvecs : ndarray or None
+        Eigenvectors stored in columns as in numpy.linalg.eigh.
+        shape=(num_band, num_band), dtype=complex
+        None when with_eigenvectors=False.
+
+    """
+    if with_eigenvectors:
+        return np.linalg.eigh(dynmat)
+
+    if np.iscomplexobj(dynmat) and (np.abs(dynmat.imag) < tolerance).all():
+        return np.linalg.eigvalsh(dynmat.real), None
+    else:
+        return np.linalg.eigvalsh(dynmat), None
+
+
+def solve_dynamical_matrices_c(
+    dm: Union[DynamicalMatrix, DynamicalMatrixWang, DynamicalMatrixGL],
+    qpoints,
+    factor,
+    with_eigenvectors=False,
+    with_dynamical_matrices=False,
+    block_size=64,
+):
+    """Build dynamical matrices in C and solve them over blocks of q-points.
+
+    Each block of stacked dynamical matrices is solved by one call of
+    numpy.linalg.eigh or eigvalsh, which loop over the leading axis inside
+    LAPACK calls. Eigenvectors are written back into the buffer of dynamical
+    matrices, so that peak memory is this buffer plus one block, unless
+    dynamical matrices are also requested.
+
+    Parameters
+    ----------
+    dm : DynamicalMatrix
+        DynamicalMatrix instance.
+    qpoints : array_like,
+        q-points in crystallographic coordinates.
+        shape=(n_qpoints, 3), dtype='double', order='C'
+    factor : float
+        Unit conversion factor from sqrt of eigenvalues to frequencies.
+    with_eigenvectors : bool, optional
+        Eigenvectors are calculated or not. Default is False.
+    with_dynamical_matrices : bool, optional
+        Dynamical matrices are returned or not. Default is False.
+    block_size : int, optional
+        Number of q-points solved at once. Default is 64.
+
+    Returns
+    -------
+    frequencies : ndarray
+        shape=(n_qpoints, num_band), dtype='double'
+    eigenvalues : ndarray
+        shape=(n_qpoints, num_band), dtype='double'
+    eigenvectors : ndarray or None
+        shape=(n_qpoints, num_band, num_band), dtype=complex
+    dynamical_matrices : ndarray or None
+        shape=(n_qpoints, num_band, num_band), dtype=complex
+
+    """
+    dynmat = run_dynamical_matrix_solver_c(dm, qpoints)
+    num_qpoints, num_band = dynmat.shape[:2]
+    eigenvalues = np.zeros((num_qpoints, num_band), dtype="double")
+    if with_eigenvectors:
+        if with_dynamical_matrices:
+            eigenvectors = np.zeros_like(dynmat)
+        else:
+            eigenvectors = dynmat
+    else:
+        eigenvectors = None
+
+    for i in range(0, num_qpoints, block_size):
+        s = slice(i, i + block_size)
+        if with_eigenvectors:
+            eigenvalues[s], eigenvectors[s] = np.linalg.eigh(dynmat[s])
+        else:
+            eigenvalues[s] = np.linalg.eigvalsh(dynmat[s])
+
+    frequencies = np.copysign(np.sqrt(np.abs(eigenvalues)), eigenvalues) * factor
+    if with_dynamical_matrices:
+        return frequencies, eigenvalues, eigenvectors, dynmat
+    else:
+        return frequencies, eigenvalues, eigenvectors, None
+
+
 def _extract_params(dm: Union[DynamicalMatrix, DynamicalMatrixNAC]):
     svecs, multi = dm.primitive.get_smallest_vectors()
     if dm.primitive.store_dense_svecs:
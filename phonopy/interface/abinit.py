@@ -34,12 +34,13 @@
 # ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import io
+import itertools
 import sys
 
 import numpy as np
 
 from phonopy.cui.settings import fracval
-from phonopy.file_IO import collect_forces
 from phonopy.interface.vasp import (
     check_forces,
     get_drift_forces,
@@ -58,13 +59,13 @@ def parse_set_of_forces(num_atoms, forces_filenames, verbose=True):
         if verbose:
             sys.stdout.write("%d. " % (i + 1))
 
-        f = open(filename)
-        abinit_forces = collect_forces(f, num_atoms, hook, [1, 2, 3])
+        with open(filename) as f:
+            abinit_forces = _collect_forces(f, num_atoms, hook)
         if check_forces(abinit_forces, num_atoms, filename, verbose=verbose):
             drift_force = get_drift_forces(
                 abinit_forces, filename=filename, verbose=verbose
             )
-            force_sets.append(np.array(abinit_forces) - drift_force)
+            force_sets.append(abinit_forces - drift_force)
         else:
             is_parsed = False
 
@@ -74,31 +75,56 @@ def parse_set_of_forces(num_atoms, forces_filenames, verbose=True):
         return []
 
 
+def _collect_forces(f, num_atoms, hook):
+    """Return forces written in num_atoms lines after the hook line.
+
+    Blank lines are skipped and the block of the following num_atoms lines is
+    parsed at once by ``np.loadtxt``. Each line is like
+    ``1 -0.00093686935947 -0.00000000000000 -0.00000000000000``.
+
+    Returns
+    -------
+    ndarray
+        shape=(num_parsed_atoms, 3), dtype='double'. When parsing failed, the
+        number of rows is different from num_atoms.
+
+    """
+    for line in f:
+        if hook in line:
+            break
+
+    lines = (line for line in f if line.strip())
+    chunk = "".join(itertools.islice(lines, num_atoms))
+    if chunk.strip() == "":
+        return np.zeros((0, 3), dtype="double")
+    try:
+        return np.loadtxt(io.StringIO(chunk), usecols=(1, 2, 3), ndmin=2)
+    except ValueError:
+        return np.zeros((0, 3), dtype="double")
+
+
 def read_abinit(filename):
     """Read crystal structure."""
     with open(filename) as f:
         abinit_in = AbinitIn(f.readlines())
     tags = abinit_in.get_variables()
-    acell = tags["acell"]
-    rprim = tags["rprim"].T
-    scalecart = tags["scalecart"]
-    lattice = rprim * acell
-    if scalecart is not None:
-        for i in range(3):
-            lattice[i] *= scalecart[i]
+    # Basis vectors are built as C-contiguous row vectors, a_i = acell_i rprim_i,
+    # so no transposed copies are needed.
+    acell = np.asarray(tags["acell"], dtype="double")
+    cell = np.multiply(tags["rprim"], acell[:, None])
+    if tags["scalecart"] is not None:
+        cell *= tags["scalecart"]
 
     if tags["xcart"] is not None:
-        pos_bohr = np.transpose(tags["xcart"])
-        positions = np.dot(np.linalg.inv(lattice), pos_bohr).T
+        positions = np.dot(tags["xcart"], np.linalg.inv(cell))
     elif tags["xangst"] is not None:
-        pos_bohr = np.transpose(tags["xangst"]) / Bohr
-        positions = np.dot(np.linalg.inv(lattice), pos_bohr).T
+        positions = np.dot(tags["xangst"] / Bohr, np.linalg.inv(cell))
     elif tags["xred"] is not None:
         positions = tags["xred"]
 
     numbers = [tags["znucl"][x - 1] for x in tags["typat"]]
 
-    return Atoms(numbers=numbers, cell=lattice.T, scaled_positions=positions)
+    return Atoms(numbers=numbers, cell=cell, scaled_positions=positions)
 
 
 def write_abinit(filename, cell):
@@ -121,28 +147,24 @@ def write_supercells_with_displacements(
 
 def get_abinit_structure(cell):
     """Return abinit structure in text."""
-    znucl = []
     numbers = cell.get_atomic_numbers()
-    for n in numbers:
-        if n not in znucl:
-            znucl.append(n)
-    typat = []
-    for n in numbers:
-        typat.append(znucl.index(n) + 1)
-
-    lines = ""
-    lines += "natom %d\n" % len(numbers)
-    lines += "typat\n"
-    lines += (" %d" * len(typat) + "\n") % tuple(typat)
-    lines += "ntypat %d\n" % len(znucl)
-    lines += ("znucl" + " %d" * len(znucl) + "\n") % tuple(znucl)
-    lines += "acell 1 1 1\n"
-    lines += "rprim\n"
-    lines += ((" % 20.16f" * 3 + "\n") * 3) % tuple(cell.get_cell().ravel())
-    lines += "xred\n"
-    lines += get_scaled_positions_lines(cell.get_scaled_positions())
-
-    return lines
+    znucl = list(dict.fromkeys(numbers))
+    znucl_index = {n: i + 1 for i, n in enumerate(znucl)}
+    typat = [znucl_index[n] for n in numbers]
+
+    lines = []
+    lines.append("natom %d" % len(numbers))
+    lines.append("typat")
+    lines.append(" " + " ".join(map(str, typat)))
+    lines.append("ntypat %d" % len(znucl))
+    lines.append("znucl " + " ".join(map(str, znucl)))
+    lines.append("acell 1 1 1")
+    lines.append("rprim")
+    lines.append(("\n".join([" % 20.16f" * 3] * 3)) % tuple(cell.get_cell().ravel()))
+    lines.append("xred")
+    lines.append(get_scaled_positions_lines(cell.get_scaled_positions()))
+
+    return "\n".join(lines)
 
 
 class AbinitIn:
@@ -209,36 +231,61 @@ class AbinitIn:
             if tag != "natom" and tag != "ntypat":
                 self._set_methods[tag]()
 
-    def _get_numerical_values(self, char_string, num_type="float"):
-        m = 1
+    def _get_numerical_values(self, num_values, num_type="float"):
+        """Return first num_values numbers of current tag.
 
-        if "*" in char_string:
-            m = int(char_string.split("*")[0])
-            str_val = char_string.split("*")[1]
-        else:
-            m = 1
-            str_val = char_string
+        Tokens are expanded with the Abinit repetition syntax ``N*val``.
+        Plain tokens are converted by numpy at once, and only rational
+        tokens such as ``1/3`` are converted one by one by ``fracval``.
+
+        Returns
+        -------
+        values : ndarray
+            Numbers, whose length is at most num_values.
+        num_tokens : int
+            Number of tokens consumed to obtain the numbers.
+
+        """
+        tokens = []
+        repeats = []
+        count = 0
+        for val in self._values:
+            if count >= num_values:
+                break
+            if "*" in val:
+                m, str_val = val.split("*")
+                m = int(m)
+            else:
+                m = 1
+                str_val = val
+            tokens.append(str_val)
+            repeats.append(m)
+            count += m
 
         if num_type == "float":
-            a = fracval(str_val)
+            try:
+                values = np.array(tokens, dtype="double")
+            except ValueError:
+                values = np.array(
+                    [fracval(x) if "/" in x else x for x in tokens], dtype="double"
+                )
         else:
-            a = int(str_val)
+            values = np.array(tokens, dtype="int_")
+        if count > len(tokens):
+            values = np.repeat(values, repeats)
+        values = values[:num_values]
 
-        return [a] * m
+        return values, len(tokens)
 
     def _set_acell(self):
-        acell = []
-        for val in self._values:
-            if len(acell) >= 3:
-                if len(val) >= 6:
-                    if val[:6] == "angstr":
-                        for i in range(3):
-                            acell[i] /= Bohr
-                break
-
-            acell += self._get_numerical_values(val)
+        acell, num_tokens = self._get_numerical_values(3)
+        if len(self._values) > num_tokens:
+            val = self._values[num_tokens]
+            if len(val) >= 6:
+                if val[:6] == "angstr":
+                    acell /= Bohr
 
-        self._tags["acell"] = acell[:3]
+        self._tags["acell"] = acell.tolist()
 
     def _set_natom(self):
         self._tags["natom"] = int(self._values[0])
@@ -247,32 +294,16 @@ class AbinitIn:
         self._tags["ntypat"] = int(self._values[0])
 
     def _set_rprim(self):
-        rprim = []
-        for val in self._values:
-            rprim += self._get_numerical_values(val)
-            if len(rprim) >= 9:
-                break
-
-        self._tags["rprim"] = np.reshape(rprim[:9], (3, 3))
+        rprim, _ = self._get_numerical_values(9)
+        self._tags["rprim"] = np.reshape(rprim, (3, 3))
 
     def _set_scalecart(self):
-        scalecart = []
-        for val in self._values:
-            scalecart += self._get_numerical_values(val)
-            if len(scalecart) >= 3:
-                break
-
-        self._tags["scalecart"] = np.array(scalecart[:3])
+        scalecart, _ = self._get_numerical_values(3)
+        self._tags["scalecart"] = scalecart
 
     def _set_typat(self):
-        typat = []
-        natom = self._tags["natom"]
-        for val in self._values:
-            typat += self._get_numerical_values(val, num_type="int")
-            if len(typat) >= natom:
-                break
-
-        self._tags["typat"] = typat[:natom]
+        typat, _ = self._get_numerical_values(self._tags["natom"], num_type="int")
+        self._tags["typat"] = typat.tolist()
 
     def _set_xangst(self):
         self._set_x_tags("xangst")
@@ -284,21 +315,10 @@ class AbinitIn:
         self._set_x_tags("xred")
 
     def _set_x_tags(self, tagname):
-        xtag = []
         natom = self._tags["natom"]
-        for val in self._values:
-            xtag += self._get_numerical_values(val)
-            if len(xtag) >= natom * 3:
-                break
-
-        self._tags[tagname] = np.reshape(xtag[: natom * 3], (-1, 3))
+        xtag, _ = self._get_numerical_values(natom * 3)
+        self._tags[tagname] = np.reshape(xtag, (-1, 3))
 
     def _set_znucl(self):
-        znucl = []
-        ntypat = self._tags["ntypat"]
-        for val in self._values:
-            znucl += self._get_numerical_values(val, num_type="int")
-            if len(znucl) >= ntypat:
-                break
-
-        self._tags["znucl"] = znucl[:ntypat]
+        znucl, _ = self._get_numerical_values(self._tags["ntypat"], num_type="int")
+        self._tags["znucl"] = znucl.tolist()
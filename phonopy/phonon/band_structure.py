@@ -762,7 +762,7 @@ class BandStructure:
         frequencies = []
         for eigs_path in self._eigenvalues:
             frequencies.append(
-                np.sqrt(abs(eigs_path)) * np.sign(eigs_path) * self._factor
+                np.copysign(np.sqrt(np.abs(eigs_path)), eigs_path) * self._factor
             )
         self._frequencies = frequencies
 
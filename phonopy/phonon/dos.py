@@ -319,15 +319,19 @@ class ProjectedDos(Dos):
         if xyz_projection:
             self._eigvecs2 = np.abs(self._eigenvectors) ** 2
         else:
-            num_atom = self._frequencies.shape[1] // 3
-            i_x = np.arange(num_atom, dtype="int") * 3
-            i_y = np.arange(num_atom, dtype="int") * 3 + 1
-            i_z = np.arange(num_atom, dtype="int") * 3 + 2
+            num_qpoints, num_band = self._frequencies.shape
+            num_atom = num_band // 3
             if direction is None:
-                self._eigvecs2 = np.abs(self._eigenvectors[:, i_x, :]) ** 2
-                self._eigvecs2 += np.abs(self._eigenvectors[:, i_y, :]) ** 2
-                self._eigvecs2 += np.abs(self._eigenvectors[:, i_z, :]) ** 2
+                # Sum x, y, z components of each atom in one reduction.
+                self._eigvecs2 = (
+                    (np.abs(self._eigenvectors) ** 2)
+                    .reshape(num_qpoints, num_atom, 3, num_band)
+                    .sum(axis=2)
+                )
             else:
+                i_x = np.arange(num_atom, dtype="int") * 3
+                i_y = np.arange(num_atom, dtype="int") * 3 + 1
+                i_z = np.arange(num_atom, dtype="int") * 3 + 2
                 d = np.array(direction, dtype="double")
                 d /= np.linalg.norm(direction)
                 proj_eigvecs = self._eigenvectors[:, i_x, :] * d[0]
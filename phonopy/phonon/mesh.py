@@ -40,7 +40,8 @@ import numpy as np
 
 from phonopy.harmonic.dynamical_matrix import (
     DynamicalMatrix,
-    run_dynamical_matrix_solver_c,
+    solve_dynamical_matrices_c,
+    solve_dynamical_matrix,
 )
 from phonopy.structure.grid_points import GridPoints
 from phonopy.units import VaspToTHz
@@ -429,16 +430,23 @@ class Mesh(MeshBase):
     def _set_phonon(self):
         import phonopy._phonopy as phonoc
 
+        if phonoc.use_openmp():
+            frequencies, _, eigenvectors, _ = solve_dynamical_matrices_c(
+                self._dynamical_matrix,
+                self._qpoints,
+                self._factor,
+                with_eigenvectors=self._with_eigenvectors,
+            )
+            self._frequencies = frequencies
+            if self._with_eigenvectors:
+                self._eigenvectors = eigenvectors
+            return
+
         num_band = len(self._cell) * 3
         num_qpoints = len(self._qpoints)
 
         self._frequencies = np.zeros((num_qpoints, num_band), dtype="double")
-        if phonoc.use_openmp():
-            dynmat = run_dynamical_matrix_solver_c(
-                self._dynamical_matrix, self._qpoints
-            )
-            eigenvectors = dynmat
-        elif self._with_eigenvectors:
+        if self._with_eigenvectors:
             dtype = "c%d" % (np.dtype("double").itemsize * 2)
             eigenvectors = np.zeros(
                 (
@@ -451,23 +459,15 @@ class Mesh(MeshBase):
             )
 
         for i, q in enumerate(self._qpoints):
-            if phonoc.use_openmp():
-                dm = dynmat[i]
-            else:
-                self._dynamical_matrix.run(q)
-                dm = self._dynamical_matrix.dynamical_matrix
+            self._dynamical_matrix.run(q)
+            dm = self._dynamical_matrix.dynamical_matrix
+            eigenvalues, eigvecs = solve_dynamical_matrix(
+                dm, with_eigenvectors=self._with_eigenvectors
+            )
             if self._with_eigenvectors:
-                eigvals, eigenvectors[i] = np.linalg.eigh(dm)
-                eigenvalues = eigvals.real
-            else:
-                eigenvalues = np.linalg.eigvalsh(dm).real
+                eigenvectors[i] = eigvecs
             self._frequencies[i] = (
-                np.array(
-                    np.sqrt(abs(eigenvalues)) * np.sign(eigenvalues),
-                    dtype="double",
-                    order="C",
-                )
-                * self._factor
+                np.copysign(np.sqrt(np.abs(eigenvalues)), eigenvalues) * self._factor
             )
 
         if self._with_eigenvectors:
@@ -529,18 +529,11 @@ class IterMesh(MeshBase):
             q = self._qpoints[self._q_count]
             self._dynamical_matrix.run(q)
             dm = self._dynamical_matrix.dynamical_matrix
-            if self._with_eigenvectors:
-                eigvals, eigenvectors = np.linalg.eigh(dm)
-                eigenvalues = eigvals.real
-            else:
-                eigenvalues = np.linalg.eigvalsh(dm).real
+            eigenvalues, eigenvectors = solve_dynamical_matrix(
+                dm, with_eigenvectors=self._with_eigenvectors
+            )
             frequencies = (
-                np.array(
-                    np.sqrt(abs(eigenvalues)) * np.sign(eigenvalues),
-                    dtype="double",
-                    order="C",
-                )
-                * self._factor
+                np.copysign(np.sqrt(np.abs(eigenvalues)), eigenvalues) * self._factor
             )
             self._q_count += 1
             return frequencies, eigenvectors
@@ -42,7 +42,8 @@ import numpy as np
 from phonopy.harmonic.dynamical_matrix import (
     DynamicalMatrix,
     DynamicalMatrixNAC,
-    run_dynamical_matrix_solver_c,
+    solve_dynamical_matrices_c,
+    solve_dynamical_matrix,
 )
 from phonopy.phonon.group_velocity import GroupVelocity
 from phonopy.structure.cells import Primitive
@@ -228,20 +229,35 @@ class QpointsPhonon:
             self._gv_obj.run(self._qpoints, perturbation=self._nac_q_direction)
             self._group_velocities = self._gv_obj.group_velocities
 
-        if self._with_dynamical_matrices:
-            dynamical_matrices = []
+        if phonoc.use_openmp():
+            (
+                self._frequencies,
+                self._eigenvalues,
+                eigenvectors,
+                dynamical_matrices,
+            ) = solve_dynamical_matrices_c(
+                self._dynamical_matrix,
+                self._qpoints,
+                self._factor,
+                with_eigenvectors=self._with_eigenvectors,
+                with_dynamical_matrices=self._with_dynamical_matrices,
+            )
+            if self._with_eigenvectors:
+                self._eigenvectors = eigenvectors
+            if self._with_dynamical_matrices:
+                self._dynamical_matrices = dynamical_matrices
+            return
 
         num_band = self._natom * 3
         num_qpoints = len(self._qpoints)
+        dtype = "c%d" % (np.dtype("double").itemsize * 2)
         self._frequencies = np.zeros((num_qpoints, num_band), dtype="double")
         self._eigenvalues = np.zeros((num_qpoints, num_band), dtype="double")
-        if phonoc.use_openmp():
-            dynmat = run_dynamical_matrix_solver_c(
-                self._dynamical_matrix, self._qpoints
+        if self._with_dynamical_matrices:
+            self._dynamical_matrices = np.zeros(
+                (num_qpoints, num_band, num_band), dtype=dtype, order="C"
             )
-            eigenvectors = dynmat
-        elif self._with_eigenvectors:
-            dtype = "c%d" % (np.dtype("double").itemsize * 2)
+        if self._with_eigenvectors:
             eigenvectors = np.zeros(
                 (
                     num_qpoints,
@@ -253,32 +269,22 @@ class QpointsPhonon:
             )
 
         for i, q in enumerate(self._qpoints):
-            if phonoc.use_openmp():
-                dm = dynmat[i]
-            else:
-                dm = self._get_dynamical_matrix(q)
+            dm = self._get_dynamical_matrix(q)
             if self._with_dynamical_matrices:
-                dynamical_matrices.append(dm)
+                self._dynamical_matrices[i] = dm
+            eigvals, eigvecs = solve_dynamical_matrix(
+                dm, with_eigenvectors=self._with_eigenvectors
+            )
             if self._with_eigenvectors:
-                eigvals, eigvecs = np.linalg.eigh(dm)
                 eigenvectors[i] = eigvecs
-            else:
-                eigvals = np.linalg.eigvalsh(dm)
-            eigvals = eigvals.real
             self._eigenvalues[i] = eigvals
             self._frequencies[i] = (
-                np.sqrt(np.abs(eigvals)) * np.sign(eigvals) * self._factor
+                np.copysign(np.sqrt(np.abs(eigvals)), eigvals) * self._factor
             )
 
         if self._with_eigenvectors:
             self._eigenvectors = eigenvectors
 
-        dtype = "c%d" % (np.dtype("double").itemsize * 2)
-        if self._with_dynamical_matrices:
-            self._dynamical_matrices = np.array(
-                dynamical_matrices, dtype=dtype, order="C"
-            )
-
     def _get_dynamical_matrix(self, q):
         if (
             isinstance(self._dynamical_matrix, DynamicalMatrixNAC)
@@ -41,6 +41,7 @@ import numpy as np
 
 from phonopy.interface.cif import write_cif_P1
 from phonopy.phonon.mesh import IterMesh, Mesh
+from phonopy.phonon.thermal_properties import get_temperature_grid
 from phonopy.units import AMU, EV, Angstrom, Hbar, Kb, THzToEv
 
 
@@ -124,29 +125,33 @@ class ThermalMotion:
         else:
             _t_step = 10
 
-        self._temperatures = np.arange(
-            _t_min, _t_max + _t_step / 2.0, _t_step, dtype="double"
-        )
+        self._temperatures = get_temperature_grid(_t_min, _t_max, _t_step)
 
     def _get_population(self, freq, t):  # freq in THz
         """Return phonon population number.
 
-        Three types of combinations of array inputs are possible.
+        Four types of combinations of array inputs are possible.
         - single freq and single t
         - single freq and len(t) > 1
         - len(freq) > 1 and single t
+        - freq and t arrays that are broadcastable, e.g., shape=(bands,) and
+          shape=(temps, 1), which gives shape=(temps, bands).
 
         """
         condition = t > 1.0
         # Avoid using isinstance with bool to distinguish from int.
         if type(condition) is bool or type(condition) is np.bool_:
             if condition:
-                return 1.0 / (np.exp(freq * THzToEv / (Kb * t)) - 1)
+                return 1.0 / np.expm1(freq * THzToEv / (Kb * t))
             else:
                 return 0.0
         else:
-            vals = np.zeros(len(t), dtype="double")
-            vals[condition] = 1.0 / (np.exp(freq * THzToEv / (Kb * t[condition])) - 1)
+            freq_b, t_b = np.broadcast_arrays(freq, t)
+            condition = t_b > 1.0
+            vals = np.zeros(t_b.shape, dtype="double")
+            vals[condition] = 1.0 / np.expm1(
+                freq_b[condition] * THzToEv / (Kb * t_b[condition])
+            )
             return vals
 
 
@@ -232,12 +237,9 @@ class ThermalDisplacements(ThermalMotion):
             if self._fmax is not None:
                 valid_indices *= fs < self._fmax
 
-            if len(temps) == 1:
-                Q2 = self._get_Q2(fs[valid_indices], temps[0])
-                disps[0] += np.dot(Q2, vecs2[valid_indices])
-            else:
-                for f, v2 in zip(fs[valid_indices], vecs2[valid_indices]):
-                    disps += np.outer(self._get_Q2(f, temps), v2)
+            # Q2 of all valid bands at all temperatures, shape=(temps, bands)
+            Q2 = self._get_Q2(fs[valid_indices], temps[:, None])
+            disps += np.dot(Q2, vecs2[valid_indices])
 
         assert np.prod(self._iter_mesh.mesh_numbers) == count + 1
         self._displacements = disps / (count + 1)
@@ -381,31 +383,44 @@ class ThermalDisplacementMatrices(ThermalMotion):
             valid_indices = freqs > self._fmin
             if self._fmax is not None:
                 valid_indices *= freqs < self._fmax
-            for i_band, (f, vec) in enumerate(
-                zip(freqs[valid_indices], (eigvecs.T)[valid_indices])
-            ):
-                c = np.zeros((len(self._masses), 3, 3), dtype=dtype_complex, order="C")
-                for i, (v, m) in enumerate(zip(vec.reshape(-1, 3), self._masses)):
-                    c[i] = np.outer(v, v.conj()) / m
-
-                # for i, t in enumerate(self._temperatures):
-                #     try:
-                #         disps[i] += self._get_Q2(f, t) * np.array(c)
-                #     except FloatingPointError as e:
-                #         # Probably, overflow in exp(freq / (kB * T))
-                #         print("%s: T=%.1f freq=%.2f (band #%d)" %
-                #               (e, t, f, i_band))
-                try:
-                    Q2 = self._get_Q2(f, self._temperatures)
-                    disps += Q2[:, None, None, None] * c[None, :, :, :]
-                except FloatingPointError as e:
-                    # Probably, overflow in exp(freq / (kB * T))
-                    print("%s: freq=%.2f (band #%d)" % (e, f, i_band))
+            freqs_valid = freqs[valid_indices]
+            num_valid = len(freqs_valid)
+            # shape=(bands, atoms, 3)
+            if num_valid == 0:
+                continue
+            vecs = (eigvecs.T)[valid_indices].reshape(num_valid, -1, 3)
+            # e e^H / m of all bands and atoms, shape=(bands, atoms, 3, 3)
+            c = (
+                vecs[:, :, :, None]
+                * vecs[:, :, None, :].conj()
+                / self._masses[None, :, None, None]
+            )
+            Q2 = self._get_Q2_of_bands(freqs_valid)
+            disps += np.dot(Q2, c.reshape(num_valid, -1)).reshape(disps.shape)
 
         assert np.prod(self._iter_mesh.mesh_numbers) == count + 1
         assert (abs(disps.imag) < 1e-10).all()
         self._disp_matrices = disps.real / (count + 1)
 
+    def _get_Q2_of_bands(self, freqs):
+        """Return Q2 of bands at all temperatures, shape=(temps, bands).
+
+        When FloatingPointError is raised, Q2 is computed band by band to
+        show which band it is, and Q2 of that band is set zero.
+
+        """
+        try:
+            return self._get_Q2(freqs, self._temperatures[:, None])
+        except FloatingPointError:
+            Q2 = np.zeros((len(self._temperatures), len(freqs)), dtype="double")
+            for i_band, f in enumerate(freqs):
+                try:
+                    Q2[:, i_band] = self._get_Q2(f, self._temperatures)
+                except FloatingPointError as e:
+                    # Probably, overflow in exp(freq / (kB * T))
+                    print("%s: freq=%.2f (band #%d)" % (e, f, i_band))
+            return Q2
+
     def write_cif(self, cell, temperature_index, filename="tdispmat.cif"):
         """Write results to file in P1 symmetry CIF format."""
         write_cif_P1(
@@ -43,6 +43,30 @@ from phonopy.phonon.mesh import Mesh
 from phonopy.units import EvTokJmol, Kb, THzToEv
 
 
+def get_temperature_grid(t_min, t_max, t_step):
+    """Return temperatures from t_min to t_max with interval t_step.
+
+    The number of temperature points is determined before generating the
+    points by rounding (t_max - t_min) / t_step to the nearest integer, so
+    that the length of the array does not depend on floating point error.
+    Exact half-step ties, e.g., t_max - t_min = 39.5 * t_step, are rounded
+    down with a small tolerance, i.e., the last temperature does not exceed
+    t_max by half a step. This follows
+    ``np.arange(t_min, t_max + t_step / 2, t_step)`` except for the ties, where
+    np.arange depends on rounding error.
+
+    Returns
+    -------
+    ndarray
+        Temperatures in K. shape=(num_temperatures,), dtype='double'
+
+    """
+    num_temps = max(int(np.floor((t_max - t_min) / t_step + 0.5 - 1e-8)) + 1, 0)
+    return np.linspace(
+        t_min, t_min + (num_temps - 1) * t_step, num_temps, dtype="double"
+    )
+
+
 def mode_cv(temp, freqs):  # freqs (eV)
     """Return mode heat capacity.
 
@@ -169,6 +193,7 @@ class ThermalPropertiesBase:
         """
         self._is_projection = is_projection
         self._band_indices = None
+        self._eigvecs2 = None
 
         if cutoff_frequency is None or cutoff_frequency < 0:
             self._cutoff_frequency = 0.0
@@ -247,9 +272,13 @@ class ThermalPropertiesBase:
                 t_property += np.sum(func(t, freqs[cond])) * w
             return t_property
         else:
+            # |e|^2 does not depend on temperature, so it is computed once and
+            # reused by all properties at all temperatures.
+            if self._eigvecs2 is None:
+                self._eigvecs2 = np.abs(self._eigenvectors) ** 2
             t_property = np.zeros(len(self._frequencies[0]), dtype="double")
             for freqs, eigvecs2, w in zip(
-                self._frequencies, np.abs(self._eigenvectors) ** 2, self._weights
+                self._frequencies, self._eigvecs2, self._weights
             ):
                 cond = freqs > self._cutoff_frequency
                 t_property += np.dot(eigvecs2[:, cond], func(t, freqs[cond])) * w
@@ -417,9 +446,7 @@ class ThermalProperties(ThermalPropertiesBase):
         else:
             _t_step = 10
 
-        self._temperatures = np.arange(
-            _t_min, _t_max + _t_step / 2.0, _t_step, dtype="double"
-        )
+        self._temperatures = get_temperature_grid(_t_min, _t_max, _t_step)
 
     def plot(
         self,
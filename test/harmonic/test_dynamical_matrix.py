@@ -4,7 +4,10 @@ import numpy as np
 import pytest
 
 from phonopy import Phonopy
-from phonopy.harmonic.dynamical_matrix import DynamicalMatrixGL
+from phonopy.harmonic.dynamical_matrix import (
+    DynamicalMatrixGL,
+    solve_dynamical_matrix,
+)
 
 dynmat_ref_000 = [
     0.052897,
@@ -543,6 +546,54 @@ def test_dynmat_wang(ph_nacl):
     ph_nacl.nac_params = nac_params
 
 
+@pytest.mark.parametrize("is_complex", [False, True])
+def test_solve_dynamical_matrix(ph_nacl_nonac: Phonopy, is_complex, monkeypatch):
+    """Test solve_dynamical_matrix with real and complex Hermitian matrices.
+
+    Dynamical matrices of NaCl are real since atoms are at inversion centers,
+    and they have to be passed to the real symmetric solver when only
+    eigenvalues are requested. Eigenvectors are always solved as complex
+    Hermitian matrix. Complex Hermitian matrix is made by adding an imaginary
+    part.
+
+    """
+    dynmat = ph_nacl_nonac.dynamical_matrix
+    dynmat.run([0.1, 0.2, 0.3])
+    dm = dynmat.dynamical_matrix
+    if is_complex:
+        a = np.arange(dm.size, dtype="double").reshape(dm.shape) / dm.size
+        dm = dm + 1j * (a - a.T)
+    eigvals_ref = np.linalg.eigvalsh(dm)
+
+    dtypes = []
+    eigh = np.linalg.eigh
+    eigvalsh = np.linalg.eigvalsh
+
+    def _eigh(a):
+        dtypes.append(a.dtype)
+        return eigh(a)
+
+    def _eigvalsh(a):
+        dtypes.append(a.dtype)
+        return eigvalsh(a)
+
+    monkeypatch.setattr(np.linalg, "eigh", _eigh)
+    monkeypatch.setattr(np.linalg, "eigvalsh", _eigvalsh)
+
+    eigvals, eigvecs = solve_dynamical_matrix(dm)
+    np.testing.assert_allclose(eigvals, eigvals_ref, atol=1e-10)
+    assert eigvecs.dtype == dm.dtype
+    np.testing.assert_allclose(dm @ eigvecs, eigvecs * eigvals, atol=1e-10)
+    eigvals_only, eigvecs_none = solve_dynamical_matrix(dm, with_eigenvectors=False)
+    assert eigvecs_none is None
+    np.testing.assert_allclose(eigvals_only, eigvals, atol=1e-10)
+
+    if is_complex:
+        assert dtypes == [np.dtype("cdouble")] * 2
+    else:
+        assert dtypes == [np.dtype("cdouble"), np.dtype("double")]
+
+
 def _test_dynmat(dynmat, lang=None):
     dtype_complex = "c%d" % (np.dtype("double").itemsize * 2)
     if lang:
@@ -4,8 +4,9 @@ import os
 
 import numpy as np
 
-from phonopy.interface.abinit import read_abinit
+from phonopy.interface.abinit import AbinitIn, parse_set_of_forces, read_abinit
 from phonopy.interface.phonopy_yaml import read_cell_yaml
+from phonopy.units import Bohr
 
 data_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -21,3 +22,52 @@ def test_read_abinit():
     assert (np.abs(diff_pos) < 1e-5).all()
     for s, s_r in zip(cell.symbols, cell_ref.symbols):
         assert s == s_r
+
+
+def test_AbinitIn_repetition():
+    """Test of N*val syntax in AbinitIn."""
+    lines = [
+        "acell 3*1.0 angstrom",
+        "rprim 0 1/2 1/2 1/2 0 1/2 2*1/2 0",
+        "natom 2 ntypat 1 znucl 14",
+        "typat 2*1",
+        "xred 3*0 3*0.25",
+    ]
+    tags = AbinitIn(lines).get_variables()
+    np.testing.assert_allclose(tags["acell"], [1 / Bohr] * 3)
+    np.testing.assert_allclose(
+        tags["rprim"], [[0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0]]
+    )
+    assert tags["typat"] == [1, 1]
+    assert tags["znucl"] == [14]
+    np.testing.assert_allclose(tags["xred"], [[0, 0, 0], [0.25, 0.25, 0.25]])
+
+
+def test_parse_set_of_forces(tmp_path):
+    """Test of parse_set_of_forces."""
+    lines = [
+        " cartesian forces (hartree/bohr) at end:",
+        "    1     -0.00093686935947    -0.00000000000000    -0.00000000000000",
+        "    2      0.00093686935947    -0.00000000000000    -0.00000000000000",
+        " cartesian forces (eV/Angstrom) at end:",
+        "    1     -0.04817596180104    -0.00000000000000     0.00000000000000",
+        "    2      0.04817596180104    -0.00000000000000     0.00000000000000",
+    ]
+    filename = tmp_path / "supercell-001.out"
+    filename.write_text("\n".join(lines) + "\n")
+    force_sets = parse_set_of_forces(2, [str(filename)], verbose=False)
+    assert len(force_sets) == 1
+    np.testing.assert_allclose(
+        force_sets[0], [[-0.04817596180104, 0, 0], [0.04817596180104, 0, 0]]
+    )
+    assert parse_set_of_forces(3, [str(filename)], verbose=False) == []
+
+    # Blank lines in the block of forces are skipped.
+    lines.insert(5, "")
+    lines.insert(4, "")
+    filename.write_text("\n".join(lines) + "\n")
+    force_sets = parse_set_of_forces(2, [str(filename)], verbose=False)
+    assert len(force_sets) == 1
+    np.testing.assert_allclose(
+        force_sets[0], [[-0.04817596180104, 0, 0], [0.04817596180104, 0, 0]]
+    )
@@ -107,6 +107,26 @@ def testPartialDOSTetrahedron(ph_nacl_nofcsym: Phonopy):
     #     print(("%f" + " %f" * len(d)) % ((f, ) + tuple(d)))
 
 
+def test_projected_dos_direction_openmp(ph_nacl_nonac: Phonopy, monkeypatch):
+    """Test directional projected DOS agrees with and without OpenMP.
+
+    NAC is not used because dynamical matrices with NAC built in C and in
+    python differ by rounding errors, which mix degenerate eigenvectors.
+
+    """
+    import phonopy._phonopy as phonoc
+
+    pdos = []
+    for use_openmp in (False, True):
+        monkeypatch.setattr(phonoc, "use_openmp", lambda: use_openmp)
+        ph_nacl_nonac.run_mesh(
+            [6, 6, 6], with_eigenvectors=True, is_mesh_symmetry=False
+        )
+        ph_nacl_nonac.run_projected_dos(direction=[1, 1, 0])
+        pdos.append(ph_nacl_nonac.projected_dos.projected_dos)
+    np.testing.assert_allclose(pdos[0], pdos[1], atol=1e-8)
+
+
 def test_get_pdos_indices(ph_tio2: Phonopy):
     """Test get_pdos_indices by TiO2."""
     indices = get_pdos_indices(ph_tio2.primitive_symmetry)
@@ -218,3 +218,23 @@ def _test_IterMesh(ph_nacl: Phonopy, freqs_ref):
     mesh_obj = ph_nacl.mesh
     mesh_freqs = mesh_obj.frequencies
     np.testing.assert_allclose(mesh_freqs, freqs, atol=1e-5)
+
+
+def test_Mesh_openmp_batch(ph_nacl: Phonopy, monkeypatch):
+    """Test that batch solver over q-point blocks agrees with q-point loop."""
+    import phonopy._phonopy as phonoc
+
+    results = []
+    for use_openmp in (False, True):
+        monkeypatch.setattr(phonoc, "use_openmp", lambda: use_openmp)
+        ph_nacl.run_mesh([11, 11, 11], with_eigenvectors=True)
+        results.append(ph_nacl.get_mesh_dict())
+    np.testing.assert_allclose(
+        results[0]["frequencies"], results[1]["frequencies"], atol=1e-6
+    )
+    eigvecs = results[1]["eigenvectors"]
+    np.testing.assert_allclose(
+        np.einsum("qji,qjk->qik", eigvecs.conj(), eigvecs),
+        np.broadcast_to(np.eye(eigvecs.shape[1]), eigvecs.shape),
+        atol=1e-8,
+    )
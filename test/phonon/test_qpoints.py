@@ -18,3 +18,30 @@ def testQpoints(ph_nacl_nofcsym: Phonopy):
         freqs = phonon.qpoints.frequencies[i] / VaspToTHz
         np.testing.assert_allclose(dm_eigs, eigs)
         np.testing.assert_allclose(freqs**2 * np.sign(freqs), eigs)
+
+
+def test_Qpoints_openmp_batch(ph_nacl_nofcsym: Phonopy, monkeypatch):
+    """Test that batch solver over q-point blocks agrees with q-point loop."""
+    import phonopy._phonopy as phonoc
+
+    phonon = ph_nacl_nofcsym
+    qpoints = np.random.default_rng(seed=7).random((70, 3)) - 0.5
+    results = []
+    for use_openmp in (False, True):
+        monkeypatch.setattr(phonoc, "use_openmp", lambda: use_openmp)
+        phonon.run_qpoints(
+            qpoints, with_eigenvectors=True, with_dynamical_matrices=True
+        )
+        results.append(phonon.qpoints)
+    np.testing.assert_allclose(
+        results[0].frequencies, results[1].frequencies, atol=1e-6
+    )
+    np.testing.assert_allclose(
+        results[0].dynamical_matrices, results[1].dynamical_matrices, atol=1e-8
+    )
+    eigvecs = results[1].eigenvectors
+    np.testing.assert_allclose(
+        (eigvecs * results[1].eigenvalues[:, None, :]) @ eigvecs.conj().swapaxes(1, 2),
+        results[1].dynamical_matrices,
+        atol=1e-8,
+    )
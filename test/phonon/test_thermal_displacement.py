@@ -120,3 +120,22 @@ def test_ThermalDisplacementMatrices(ph_sno2):
     tdm = ph_sno2.thermal_displacement_matrices
     mat = tdm.thermal_displacement_matrices
     np.testing.assert_allclose(tdm_ref, mat.reshape(-1, 3), atol=1e-5)
+
+
+def test_ThermalDisplacementMatrices_freq_window(ph_nacl):
+    """Test for ThermalDisplacementMatrices with q-points without valid bands.
+
+    Contributions of bands in frequency windows are additive.
+
+    """
+    ph_nacl.init_mesh(
+        [4, 4, 4], with_eigenvectors=True, is_mesh_symmetry=False, use_iter_mesh=True
+    )
+    mats = []
+    for freq_min, freq_max in ((0.5, 1.0), (1e-2, 3.0), (3.0, None), (1e-2, None)):
+        ph_nacl.run_thermal_displacement_matrices(
+            t_min=100, t_max=300, t_step=100, freq_min=freq_min, freq_max=freq_max
+        )
+        mats.append(ph_nacl.thermal_displacement_matrices.thermal_displacement_matrices)
+    assert np.isfinite(mats[0]).all()
+    np.testing.assert_allclose(mats[1] + mats[2], mats[3], atol=1e-10)
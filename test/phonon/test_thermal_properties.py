@@ -1,6 +1,9 @@
 """Tests for thermal property calculation."""
 
 import numpy as np
+import pytest
+
+from phonopy.phonon.thermal_properties import get_temperature_grid
 
 temps = [
     0.000000,
@@ -78,3 +81,25 @@ def _test_thermal_properties(ph):
             tp.run(lang="py")
         for vals_ref, vals in zip((temps, fes, entropies, cvs), tp.thermal_properties):
             np.testing.assert_allclose(vals_ref, vals, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "t_min,t_max,t_step,num_temps,t_last",
+    [
+        (0, 1000, 10, 101, 1000),
+        (0, 1005, 10, 101, 1000),
+        (0, 1006, 10, 102, 1010),
+        (10, 20, 0.1, 101, 20),
+        (21, 32.85, 0.3, 40, 32.7),
+        (0, 0.25, 0.1, 3, 0.2),
+        (100, 50, 10, 0, None),
+    ],
+)
+def test_get_temperature_grid(t_min, t_max, t_step, num_temps, t_last):
+    """Test of get_temperature_grid with integer, fractional, tie steps."""
+    temps = get_temperature_grid(t_min, t_max, t_step)
+    assert len(temps) == num_temps
+    if num_temps:
+        assert temps[0] == pytest.approx(t_min)
+        assert temps[-1] == pytest.approx(t_last)
+        np.testing.assert_allclose(np.diff(temps), t_step)